@@ -1,6 +1,25 @@
+from Cython.Build import cythonize
+
+extensions = [
+    'pfun/either.py',
+    'pfun/trampoline.py',
+    'pfun/list.py'
+]
+
+
 def build(setup_kwargs):
     setup_kwargs.update(
         {
+            "ext_modules": cythonize(
+                extensions,
+                nthreads=4,
+                compiler_directives={
+                    'language_level': 3,
+                    'infer_types': True,
+                    'optimize.use_switch': True,
+                    'optimize.unpack_method_calls': True
+                }
+            ),
             "package_data": {"pfun": ["py.typed"]}
         }
     )
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from asyncio import iscoroutine
 from typing import (Awaitable, Callable, Generic, Iterable, List, TypeVar,
-                    Union, cast)
+                    Union)
 
 from .immutable import Immutable
 from .monad import Monad
@@ -60,7 +60,7 @@ class Trampoline(Immutable, Monad, Generic[A], ABC):
         while not trampoline._is_done:
             trampoline = await trampoline._resume()
 
-        return cast(Done[A], trampoline).a
+        return trampoline.a  # type: ignore
 
 
 class Done(Trampoline[A]):
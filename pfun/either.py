@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from functools import wraps
-from typing import Any, Callable, Generic, Iterable, TypeVar, Union, cast
+from functools import lru_cache, wraps
+from typing import (Any, Callable, Generic, Iterable, List, Optional,
+                    TypeVar, Union)
 
-from .functions import curry
 from .immutable import Immutable
-from .monad import Monad, filter_m_, map_m_
+from .monad import Monad
 
 A = TypeVar('A', covariant=True)
 B = TypeVar('B', covariant=True)
@@ -14,14 +13,15 @@ C = TypeVar('C')
 D = TypeVar('D')
 
 
-class Either_(Immutable, Monad, ABC):
+class Either_(Immutable, Monad):
     """
     Abstract class representing a computation with either
     ``A`` or ``B`` as its result.
     Should not be instantiated directly,
     use `Left` or `Right` instead
     """
-    @abstractmethod
+    __slots__ = ()
+
     def and_then(self, f):
         """
         Chain together functions of either computations, keeping
@@ -42,7 +42,6 @@ class Either_(Immutable, Monad, ABC):
         """
         raise NotImplementedError()
 
-    @abstractmethod
     def __bool__(self) -> bool:
         """
         Convert this result to a boolean value
@@ -60,7 +59,6 @@ class Either_(Immutable, Monad, ABC):
         """
         raise NotImplementedError()
 
-    @abstractmethod
     def or_else(self, default):
         """
         Try to get the result of this either computation, return default
@@ -80,7 +78,6 @@ class Either_(Immutable, Monad, ABC):
         """
         raise NotImplementedError()
 
-    @abstractmethod
     def map(self, f):
         """
         Map the result of this either computation
@@ -108,6 +105,8 @@ class Right(Either_, Generic[A]):
     """
     Represents the ``Right`` case of ``Either``
     """
+    __slots__ = ('get', )
+
     get: A
     """
     The right result
@@ -138,19 +137,24 @@ class Right(Either_, Generic[A]):
             True if other is a `Right` instance and wraps the same \
             value as this instance, False otherwise
         """
-        return isinstance(other, Right) and self.get == other.get
+        return type(other) is Right and self.get == other.get
+
+    def __hash__(self) -> int:
+        return hash((True, self.get))
 
     def __bool__(self) -> bool:
         return True
 
     def __repr__(self):
-        return f'Right({repr(self.get)})'
+        return 'Right(%r)' % (self.get, )
 
 
 class Left(Either_, Generic[B]):
     """
     Represents the ``Left`` case of ``Either``
     """
+    __slots__ = ('get', )
+
     get: B
     """
     The left result
@@ -161,7 +165,7 @@ class Left(Either_, Generic[B]):
     def map(self, f: Callable[[A], C]) -> Either[B, C]:
         return self
 
-    def __eq__(self, other: object) -> bool:
+    def __eq__(self, other: Any) -> bool:
         """
         Test if ``other`` is an `Left` wrapping the same value as
         this instance
@@ -178,7 +182,10 @@ class Left(Either_, Generic[B]):
             True if other is an `Left` instance and wraps the same \
             value as this instance, False otherwise
         """
-        return isinstance(other, Left) and other.get == self.get
+        return type(other) is Left and other.get == self.get
+
+    def __hash__(self) -> int:
+        return hash((False, self.get))
 
     def __bool__(self) -> bool:
         return False
@@ -187,7 +194,7 @@ class Left(Either_, Generic[B]):
         return self
 
     def __repr__(self):
-        return f'Left({repr(self.get)})'
+        return 'Left(%r)' % (self.get, )
 
 
 Either = Union[Left[B], Right[A]]
@@ -232,6 +239,17 @@ def sequence(iterable: Iterable[Either[A, B]]) -> Either[A, Iterable[B]]:
     Return:
         ``Either`` of collected results
     """
+    if isinstance(iterable, (list, tuple)):
+        # preallocate the output to skip the list resizes of the
+        # generic append loop
+        result: List[Any] = [None] * len(iterable)
+        i = 0
+        for either in iterable:
+            if isinstance(either, Left):
+                return either
+            result[i] = either.get
+            i += 1
+        return Right(tuple(result))
     result = []
     for either in iterable:
         if isinstance(either, Left):
@@ -240,14 +258,15 @@ def sequence(iterable: Iterable[Either[A, B]]) -> Either[A, Iterable[B]]:
     return Right(tuple(result))
 
 
-@curry
-def for_each(f: Callable[[A], Either[B, C]], iterable: Iterable[A]
+def for_each(f: Callable[[A], Either[B, C]],
+             iterable: Optional[Iterable[A]] = None
              ) -> Either[B, Iterable[C]]:
     """
     Map each in element in ``iterable`` to
     an `Either` by applying ``f``,
     combine the elements by ``and_then``
-    from left to right and collect the results
+    from left to right and collect the results.
+    Can be partially applied by calling with just ``f``
 
     Example:
         >>> for_each(Right, range(3))
@@ -259,16 +278,35 @@ def for_each(f: Callable[[A], Either[B, C]], iterable: Iterable[A]
     Return:
          ``f`` mapped over ``iterable`` and combined from left to right.
     """
-    return cast(Either[B, Iterable[C]], map_m_(Right, f, iterable))
+    if iterable is None:
+        return lambda iterable: for_each(f, iterable)  # type: ignore
+    if isinstance(iterable, (list, tuple)):
+        result: List[Any] = [None] * len(iterable)
+        i = 0
+        for a in iterable:
+            either = f(a)
+            if isinstance(either, Left):
+                return either
+            result[i] = either.get
+            i += 1
+        return Right(tuple(result))
+    result = []
+    for a in iterable:
+        either = f(a)
+        if isinstance(either, Left):
+            return either
+        result.append(either.get)
+    return Right(tuple(result))
 
 
-@curry
-def filter_(f: Callable[[A], Either[B, bool]], iterable: Iterable[A]
+def filter_(f: Callable[[A], Either[B, bool]],
+            iterable: Optional[Iterable[A]] = None
             ) -> Either[B, Iterable[A]]:
     """
     Map each element in ``iterable`` by applying ``f``,
     filter the results by the value returned by ``f``
     and combine from left to right.
+    Can be partially applied by calling with just ``f``
 
     Example:
         >>> filter(lambda v: Right(v % 2 == 0), range(3))
@@ -280,7 +318,27 @@ def filter_(f: Callable[[A], Either[B, bool]], iterable: Iterable[A]
     Return:
         `iterable` mapped and filtered by `f`
     """
-    return cast(Either[B, Iterable[A]], filter_m_(Right, f, iterable))
+    if iterable is None:
+        return lambda iterable: filter_(f, iterable)  # type: ignore
+    if isinstance(iterable, (list, tuple)):
+        result: List[Any] = [None] * len(iterable)
+        i = 0
+        for a in iterable:
+            either = f(a)
+            if isinstance(either, Left):
+                return either
+            if either.get:
+                result[i] = a
+                i += 1
+        return Right(tuple(result[:i]))
+    result = []
+    for a in iterable:
+        either = f(a)
+        if isinstance(either, Left):
+            return either
+        if either.get:
+            result.append(a)
+    return Right(tuple(result))
 
 
 def tail_rec(f: Callable[[D], Either[C, Either[D, B]]], a: D) -> Either[C, B]:
@@ -315,10 +373,31 @@ def tail_rec(f: Callable[[D], Either[C, Either[D, B]]], a: D) -> Either[C, B]:
     return inner_either
 
 
+def _catch(f: Callable[..., A]) -> Callable[..., Either[Exception, A]]:
+    # the closure bindings save a module-global lookup per call without
+    # reserving any keyword names from the caller
+    _Right = Right
+    _Left = Left
+    _Exception = Exception
+
+    @wraps(f)
+    def decorator(*args, **kwargs) -> Either[Exception, A]:
+        try:
+            return _Right(f(*args, **kwargs))
+        except _Exception as e:
+            return _Left(e)
+
+    return decorator
+
+
+_catch_cached = lru_cache(maxsize=256)(_catch)
+
+
 def catch(f: Callable[..., A]) -> Callable[..., Either[Exception, A]]:
     """
     Decorator that wraps return values of decoratod functions with `Right`,
-    and wraps catched exceptions with `Left`
+    and wraps catched exceptions with `Left`.
+    Decorating the same hashable function twice returns the same wrapper
 
     Example:
         >>> catch_division = catch(lambda v: 1 / v)
@@ -332,14 +411,11 @@ def catch(f: Callable[..., A]) -> Callable[..., Either[Exception, A]]:
     Return:
         decorated function
     """
-    @wraps(f)
-    def decorator(*args, **kwargs) -> Either[Exception, A]:
-        try:
-            return Right(f(*args, **kwargs))
-        except Exception as e:
-            return Left(e)
-
-    return decorator
+    try:
+        return _catch_cached(f)
+    except TypeError:
+        # unhashable callables can't go through the cache
+        return _catch(f)
 
 
 __all__ = [
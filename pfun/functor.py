@@ -6,6 +6,8 @@ class Functor(ABC):
     """
     Abstract base class for functors
     """
+    __slots__ = ()
+
     @abstractmethod
     def map(self, f: Callable[[Any], Any]) -> 'Functor':
         """
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import TypeVar
 
 T = TypeVar('T')
@@ -18,6 +18,7 @@ class Immutable:
         AttributeError: <__main__.B object at 0x10f99a0f0> is immutable
 
     """
+    __slots__ = ()
 
     def __init_subclass__(
         cls, init=True, repr=True, eq=True, order=False, unsafe_hash=False
@@ -29,6 +30,13 @@ class Immutable:
             frozen=True, init=init, repr=repr, eq=eq, order=order
         )(cls)
 
+    def __getstate__(self):
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
     def clone(self: T, **kwargs) -> T:
         """
         Make a shallow copy of an instance, potentially overwriting
@@ -48,7 +56,7 @@ class Immutable:
             New instance of same type with copied and overwritten fields
 
         """
-        attrs = self.__dict__.copy()
+        attrs = {f.name: getattr(self, f.name) for f in fields(self)}
         attrs.update(kwargs)
         return type(self)(**attrs)  # type: ignore
 
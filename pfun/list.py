@@ -1,6 +1,6 @@
 import builtins
 from functools import reduce
-from typing import Callable, Iterable, Optional, Tuple, TypeVar, cast
+from typing import Callable, Iterable, Optional, Tuple, TypeVar
 
 from .functions import curry
 from .monad import Monad, filter_m_, map_m_, sequence_
@@ -182,7 +182,7 @@ def for_each(f: Callable[[A], List[B]], iterable: Iterable[A]
     Return:
         ``f`` mapped over ``iterable`` and combined from left to right.
     """
-    return cast(List[Iterable[B]], map_m_(value, f, iterable))
+    return map_m_(value, f, iterable)  # type: ignore
 
 
 def sequence(iterable: Iterable[List[A]]) -> List[Iterable[A]]:
@@ -199,7 +199,7 @@ def sequence(iterable: Iterable[List[A]]) -> List[Iterable[A]]:
     Return:
         ``List`` of collected results
     """
-    return cast(List[Iterable[A]], sequence_(value, iterable))
+    return sequence_(value, iterable)  # type: ignore
 
 
 @curry
@@ -219,7 +219,7 @@ def filter_(f: Callable[[A], List[bool]], iterable: Iterable[A]
     Return:
         `iterable` mapped and filtered by `f`
     """
-    return cast(List[Iterable[A]], filter_m_(value, f, iterable))
+    return filter_m_(value, f, iterable)  # type: ignore
 
 
 __all__ = [
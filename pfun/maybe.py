@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from functools import wraps
 from typing import (Any, Callable, Generic, Iterable, Optional, Sequence,
-                    TypeVar, Union, cast)
+                    TypeVar, Union)
 
 from .either import Either, Left
 from .functions import curry
@@ -165,6 +165,15 @@ class Nothing(Maybe_):
     Represents a failed computation
 
     """
+    _instance = None
+
+    def __new__(cls) -> 'Nothing':
+        # Nothing carries no state, so all instances are interned to a
+        # single sentinel, making construction allocation-free
+        if cls._instance is None:
+            cls._instance = object.__new__(cls)
+        return cls._instance
+
     def and_then(self, f: Callable[[A], 'Maybe[B]']) -> 'Maybe[B]':
         return self
 
@@ -267,7 +276,7 @@ def for_each(f: Callable[[A], Maybe[B]], iterable: Iterable[A]
     Return:
         ``f`` mapped over ``iterable`` and combined from left to right.
     """
-    return cast(Maybe[Iterable[B]], map_m_(Just, f, iterable))
+    return map_m_(Just, f, iterable)  # type: ignore
 
 
 def sequence(iterable: Iterable[Maybe[A]]) -> Maybe[Iterable[A]]:
@@ -283,7 +292,7 @@ def sequence(iterable: Iterable[Maybe[A]]) -> Maybe[Iterable[A]]:
     Return:
         ``Maybe`` of collected results
     """
-    return cast(Maybe[Iterable[A]], sequence_(Just, iterable))
+    return sequence_(Just, iterable)  # type: ignore
 
 
 @curry
@@ -304,7 +313,7 @@ def filter_(f: Callable[[A], Maybe[bool]], iterable: Iterable[A]
     Return:
         `iterable` mapped and filtered by `f`
     """
-    return cast(Maybe[Iterable[A]], filter_m_(Just, f, iterable))
+    return filter_m_(Just, f, iterable)  # type: ignore
 
 
 S = TypeVar('S')
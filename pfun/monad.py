@@ -10,6 +10,8 @@ class Monad(Functor, ABC):
     """
     Base class for all monadic types
     """
+    __slots__ = ()
+
     @abstractmethod
     def and_then(self, f: Callable[[Any], Any]) -> 'Monad':
         pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Callable, Generic, Iterable, TypeVar, cast
+from typing import Callable, Generic, Iterable, TypeVar
 
 from .functions import curry
 from .immutable import Immutable
@@ -64,7 +64,7 @@ class Trampoline(Immutable, Generic[A], Monad, ABC):
         while not trampoline._is_done:
             trampoline = trampoline._resume()
 
-        return cast(Done[A], trampoline).a
+        return trampoline.a  # type: ignore
 
 
 class Done(Trampoline[A]):
@@ -138,7 +138,7 @@ def for_each(f: Callable[[A], Trampoline[B]], iterable: Iterable[A]
     Return:
         ``f`` mapped over ``iterable`` and combined from left to right.
     """
-    return cast(Trampoline[Iterable[B]], map_m_(Done, f, iterable))
+    return map_m_(Done, f, iterable)  # type: ignore
 
 
 def sequence(iterable: Iterable[Trampoline[A]]) -> Trampoline[Iterable[A]]:
@@ -155,7 +155,7 @@ def sequence(iterable: Iterable[Trampoline[A]]) -> Trampoline[Iterable[A]]:
     Return:
         ``Trampoline`` of collected results
     """
-    return cast(Trampoline[Iterable[A]], sequence_(Done, iterable))
+    return sequence_(Done, iterable)  # type: ignore
 
 
 @curry
@@ -176,7 +176,7 @@ def filter_(f: Callable[[A], Trampoline[bool]],
     Return:
         `iterable` mapped and filtered by `f`
     """
-    return cast(Trampoline[Iterable[A]], filter_m_(Done, f, iterable))
+    return filter_m_(Done, f, iterable)  # type: ignore
 
 
 __all__ = [
@@ -1,92 +1,118 @@
-from hypothesis.strategies import (booleans, builds, composite, dictionaries,
-                                   floats, integers, just)
+import functools
+
+from hypothesis.strategies import (booleans, builds, dictionaries, floats,
+                                   integers, just)
 from hypothesis.strategies import lists as lists_
-from hypothesis.strategies import none, one_of, text, tuples
+from hypothesis.strategies import none, one_of, recursive, text, tuples
 
-from pfun import Dict, List, aio_trampoline, effect, maybe, trampoline
+from pfun import Dict, List, aio_trampoline, always, effect, maybe, trampoline
 from pfun.either import Left, Right
 
 
+@functools.lru_cache(maxsize=4)
 def _everything(allow_nan=False):
     return integers(), booleans(), text(), floats(allow_nan=allow_nan)
 
 
+_anything = one_of(*_everything(False))
+_anything_allow_nan = one_of(*_everything(True))
+
+
 def anything(allow_nan=False):
-    return one_of(*_everything(allow_nan))
+    return _anything_allow_nan if allow_nan else _anything
 
 
-def unaries(return_strategy=anything()):
+def unaries(return_strategy=None):
+    if return_strategy is None:
+        return_strategy = anything()
+
     def _(a):
         return lambda _: a
 
     return builds(_, return_strategy)
 
 
-def maybes(value_strategy=anything()):
+_nothings = just(maybe.Nothing())
+
+
+def maybes(value_strategy=None):
+    if value_strategy is None:
+        value_strategy = anything()
     justs = builds(maybe.Just, value_strategy)
-    nothings = just(maybe.Nothing())
-    return one_of(justs, nothings)
+    return one_of(justs, _nothings)
 
 
-def rights(value_strategy=anything()):
+def rights(value_strategy=None):
+    if value_strategy is None:
+        value_strategy = anything()
     return builds(Right, value_strategy)
 
 
-def lefts(value_strategy=anything()):
+def lefts(value_strategy=None):
+    if value_strategy is None:
+        value_strategy = anything()
     return builds(Left, value_strategy)
 
 
-def eithers(value_strategy=anything()):
-    return one_of(lefts(), rights())
+def eithers(value_strategy=None):
+    return one_of(lefts(value_strategy), rights(value_strategy))
+
 
+def nullaries(value_strategy=None):
+    if value_strategy is None:
+        value_strategy = anything()
 
-def nullaries(value_strategy=anything()):
     def f(v):
         return lambda: v
 
     return builds(f, value_strategy)
 
 
-def trampolines(value_strategy=anything()):
+@functools.lru_cache(maxsize=8)
+def trampolines(value_strategy=None):
+    if value_strategy is None:
+        value_strategy = anything()
     dones = builds(trampoline.Done, value_strategy)
 
-    @composite
-    def call(draw):
-        t = draw(trampolines(value_strategy))
-        return trampoline.Call(lambda: t)
-
-    @composite
-    def and_then(draw):
-        t = draw(trampolines(value_strategy))
-        cont = lambda _: t
-        return trampoline.AndThen(draw(trampolines(value_strategy)), cont)
+    def extend(children):
+        calls = builds(lambda t: trampoline.Call(always(t)), children)
+        and_thens = builds(
+            lambda t, t2: trampoline.AndThen(t, always(t2)),
+            children,
+            children
+        )
+        return one_of(calls, and_thens)
 
-    return one_of(dones, call(), and_then())
+    return recursive(dones, extend)
 
 
-def aio_trampolines(value_strategy=anything()):
+@functools.lru_cache(maxsize=8)
+def aio_trampolines(value_strategy=None):
+    if value_strategy is None:
+        value_strategy = anything()
     dones = builds(aio_trampoline.Done, value_strategy)
 
-    @composite
-    def call(draw):
-        t = draw(aio_trampolines(value_strategy))
+    def extend(children):
+        def make_call(t):
+            async def f():
+                return t
 
-        async def f():
-            return t
-        return aio_trampoline.Call(f)
+            return aio_trampoline.Call(f)
 
-    @composite
-    def and_then(draw):
-        t = draw(aio_trampolines(value_strategy))
-        cont = lambda _: t
-        return aio_trampoline.AndThen(
-            draw(aio_trampolines(value_strategy)), cont
+        calls = builds(make_call, children)
+        and_thens = builds(
+            lambda t, t2: aio_trampoline.AndThen(t, always(t2)),
+            children,
+            children
         )
+        return one_of(calls, and_thens)
 
-    return one_of(dones, call(), and_then())
+    return recursive(dones, extend)
 
 
-def lists(element_strategies=_everything(allow_nan=False), min_size=0):
+def lists(element_strategies=None, min_size=0):
+    if element_strategies is None:
+        element_strategies = _everything(allow_nan=False)
     return builds(
         List,
         one_of(
@@ -98,12 +124,15 @@ def lists(element_strategies=_everything(allow_nan=False), min_size=0):
     )
 
 
-def dicts(keys=text(), values=anything(), min_size=0, max_size=None):
+def dicts(keys=text(), values=None, min_size=0, max_size=None):
+    if values is None:
+        values = anything()
     return builds(
         Dict, dictionaries(keys, values, min_size=min_size, max_size=max_size)
     )
 
 
+@functools.lru_cache(maxsize=1)
 def monoids():
     return one_of(
         lists_(anything()),
@@ -116,5 +145,7 @@ def monoids():
     )
 
 
-def effects(value_strategy=anything()):
+def effects(value_strategy=None):
+    if value_strategy is None:
+        value_strategy = anything()
     return builds(effect.success, value_strategy)
@@ -43,6 +43,10 @@ class TestEither(MonadTest):
         assert Right(first) != Right(second)
         assert Left(first) != Right(first)
 
+    @given(anything())
+    def test_hash(self, value):
+        assert len({Right(value), Right(value), Left(value)}) == 2
+
     @given(anything())
     def test_identity_law(self, value):
         assert Left(value).map(identity) == Left(value)